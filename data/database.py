@@ -1,33 +1,73 @@
 # backend/data/database.py
 from sqlmodel import create_engine, SQLModel, Session, text
+from sqlalchemy.pool import StaticPool
 from backend.core.config import settings
+from contextlib import contextmanager
+import hashlib
 import logging
 import os
 
 logger = logging.getLogger(__name__)
 
+# File path of the SQLite database (None for in-memory / non-SQLite)
+_db_file = None
+
 # Ensure the directory for the database exists
 if settings.DATABASE_URL.startswith("sqlite:///"):
     db_path = settings.DATABASE_URL.replace("sqlite:///", "")
     # Skip directory creation for in-memory databases
     if not db_path.startswith(":memory:"):
+        _db_file = db_path
         db_dir = os.path.dirname(db_path)
         if db_dir and not os.path.exists(db_dir):
             os.makedirs(db_dir, exist_ok=True)
             logger.info(f"Created database directory: {db_dir}")
 
+# Verbose SQL logging is opt-in via SQL_TRACE rather than tied to DEBUG:
+# engine echo invokes Python logging per statement, which dominates CPU
+# during bulk work like the demo load
+if os.environ.get("SQL_TRACE"):
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+
 # Create engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
-)
+_engine_kwargs = {
+    "echo": False,
+    "connect_args": {"check_same_thread": False},  # Needed for SQLite
+}
+if settings.DATABASE_URL.startswith("sqlite"):
+    if ":memory:" in settings.DATABASE_URL:
+        # Every session must share the one in-memory database; the default
+        # pool opens a fresh (empty) DB per connection
+        _engine_kwargs["poolclass"] = StaticPool
+    else:
+        # SQLite serializes writers anyway, so keep a single pooled
+        # connection instead of churning through new ones per request
+        _engine_kwargs["pool_size"] = 1
+        _engine_kwargs["max_overflow"] = 0
+
+engine = create_engine(settings.DATABASE_URL, **_engine_kwargs)
+
+# Cached (schema_version, existing table names) so repeated verify_tables()
+# calls don't re-scan sqlite_master unless the schema actually changed
+_table_cache = None
+
+def _get_existing_tables(conn):
+    """Get the set of existing table names, cached by SQLite schema version"""
+    global _table_cache
+    schema_version = conn.execute(text("PRAGMA schema_version;")).scalar()
+    if _table_cache is not None and _table_cache[0] == schema_version:
+        return _table_cache[1]
+
+    result = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table';"))
+    existing_tables = frozenset(r[0] for r in result)
+    _table_cache = (schema_version, existing_tables)
+    return existing_tables
 
 def verify_tables():
     """Verify all required tables exist"""
     required_tables = [
         "companies",
-        "products", 
+        "products",
         "users",
         "campaigns",
         "content_assets",
@@ -39,24 +79,45 @@ def verify_tables():
         "game_state",
         "campaign_metrics"
     ]
-    
+
     with engine.connect() as conn:
-        # Get existing tables
-        result = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table';"))
-        existing_tables = [row[0] for row in result]
-        
+        existing_tables = _get_existing_tables(conn)
+
         # Check for missing tables
         missing_tables = [t for t in required_tables if t not in existing_tables]
-        
+
         if missing_tables:
             logger.warning(f"Missing database tables: {missing_tables}")
             return False
-        
+
         logger.info(f"All {len(required_tables)} required tables present")
         return True
 
+def _sentinel_path():
+    """Path of the 'initialized' marker written next to the SQLite file"""
+    if _db_file:
+        return _db_file + ".initialized"
+    return None
+
+def _schema_fingerprint():
+    """Stable hash of the declared schema (tables, columns and indexes)"""
+    parts = []
+    for name in sorted(SQLModel.metadata.tables):
+        table = SQLModel.metadata.tables[name]
+        parts.append(name)
+        parts.extend(f"{c.name}:{c.type}" for c in table.columns)
+        parts.extend(sorted(idx.name for idx in table.indexes if idx.name))
+    return hashlib.blake2b("|".join(parts).encode()).hexdigest()
+
+# Guards init_db against running twice if imported/called from more than
+# one entry point
+_initialized = False
+
 def init_db():
     """Initialize database tables"""
+    global _initialized
+    if _initialized:
+        return
     try:
         # Import all models to ensure they're registered
         from data.models import (
@@ -64,17 +125,29 @@ def init_db():
             Metric, CustomerSegment, Schedule, SetupConfiguration,
             Transaction, GameState, CampaignMetrics
         )
-        
-        # Check if database exists and has tables
+
+        # Warm start: if the schema hash recorded after the last successful
+        # init still matches, skip all schema verification and creation
+        sentinel = _sentinel_path()
+        fingerprint = _schema_fingerprint()
+        if sentinel and os.path.exists(sentinel) and os.path.exists(_db_file):
+            try:
+                with open(sentinel) as f:
+                    if f.read().strip() == fingerprint:
+                        logger.info("Database already initialized (sentinel match), skipping schema work")
+                        _initialized = True
+                        return
+            except OSError:
+                pass
+
+        # Check if database exists and has tables (single connection/query)
         tables_exist = False
         try:
             with engine.connect() as conn:
-                result = conn.execute(text("SELECT COUNT(*) FROM sqlite_master WHERE type='table';"))
-                table_count = result.scalar()
-                tables_exist = table_count > 0
+                tables_exist = len(_get_existing_tables(conn)) > 0
         except Exception:
             pass
-        
+
         if tables_exist:
             # Database exists, verify all tables are present
             if not verify_tables():
@@ -83,22 +156,47 @@ def init_db():
                 SQLModel.metadata.create_all(engine)
                 verify_tables()  # Verify again
         else:
-            # Create all tables from scratch
+            # Create all tables from scratch. The sqlite_master scan above
+            # proved none exist, so skip the per-table checkfirst probes and
+            # commit every CREATE TABLE in a single transaction/fsync
             logger.info("Creating all database tables...")
-            SQLModel.metadata.create_all(engine)
+            with engine.begin() as conn:
+                SQLModel.metadata.create_all(conn, checkfirst=False)
             verify_tables()
-        
+
+        # Backfill declared indexes on databases created before the models
+        # carried index=True (create_all only covers brand-new tables)
+        with engine.begin() as conn:
+            for table in SQLModel.metadata.tables.values():
+                for idx in table.indexes:
+                    columns = ", ".join(c.name for c in idx.columns)
+                    conn.execute(text(
+                        f"CREATE INDEX IF NOT EXISTS {idx.name} ON {table.name} ({columns})"
+                    ))
+
         logger.info(f"Database initialized successfully at: {settings.DATABASE_URL}")
-        
-        # Load demo data if database is empty
-        with Session(engine) as session:
-            from data.models import Company
-            company_count = session.query(Company).count()
-            if company_count == 0:
-                logger.info("Database is empty, loading demo data...")
-                from data.demo_loader import load_demo_data
-                load_demo_data()
-                
+
+        # Load demo data if database is empty; EXISTS stops at the first row
+        # instead of scanning the whole table like COUNT(*)
+        with engine.connect() as conn:
+            has_companies = conn.execute(
+                text("SELECT EXISTS(SELECT 1 FROM companies LIMIT 1);")
+            ).scalar()
+        if not has_companies:
+            logger.info("Database is empty, loading demo data...")
+            from data.demo_loader import load_demo_data
+            load_demo_data()
+
+        # Record the schema hash so subsequent starts can skip schema work
+        if sentinel:
+            try:
+                with open(sentinel, "w") as f:
+                    f.write(fingerprint)
+            except OSError as e:
+                logger.warning(f"Could not write init sentinel {sentinel}: {e}")
+
+        _initialized = True
+
     except Exception as e:
         logger.error(f"Error initializing database: {str(e)}")
         raise
@@ -107,3 +205,16 @@ def get_session():
     """Get database session"""
     with Session(engine) as session:
         yield session
+
+@contextmanager
+def get_db_session():
+    """Context-managed session: commits on success, rolls back on error"""
+    session = Session(engine)
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
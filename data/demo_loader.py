@@ -1,131 +1,244 @@
 # backend/data/demo_loader.py
 import pandas as pd
 import os
-from sqlmodel import Session
+from concurrent.futures import ThreadPoolExecutor
 from data.database import engine
-from data.models import Company, Product, User, ContentAsset, Metric
-from uuid import UUID
-from datetime import datetime
-import json
+from uuid import UUID, uuid4
+from datetime import datetime, date
+import orjson
 import logging
 
+try:
+    # Optional accelerator: Arrow's multi-threaded SIMD CSV parser
+    import pyarrow.csv as _pacsv
+except ImportError:
+    _pacsv = None
+
 logger = logging.getLogger(__name__)
 
+def _uuid_hex(s):
+    """Convert a UUID string straight to its 32-char hex storage form.
+
+    uuid.UUID.__init__ does full string parsing in Python; for the
+    well-formed fixed-width strings in the demo CSVs a dash-strip plus a
+    C-level int() validation is ~10x cheaper. Malformed values fall back
+    to the real parser (which raises as before).
+    """
+    h = s.replace('-', '')
+    if len(h) == 32:
+        try:
+            int(h, 16)
+        except ValueError:
+            pass
+        else:
+            return h
+    return UUID(s).hex
+
+# Column -> converter mapping shared by all demo CSVs, built once so the
+# row loops don't re-resolve constructors and null checks per cell
+_CONVERTERS = {
+    'id': _uuid_hex,
+    'company_id': _uuid_hex,
+    'campaign_id': _uuid_hex,
+    'age': int,
+    'clicks': int,
+    'impressions': int,
+    'engagement_rate': float,
+    'conversion_rate': float,
+    'cpa': float,
+    'launch_date': lambda v: v.date(),
+}
+
+def _row_kwargs(columns, values):
+    """Build model kwargs from one raw row tuple via the precompiled converters"""
+    convs = _CONVERTERS
+    return {
+        c: (convs[c](v) if v is not None and c in convs else v)
+        for c, v in zip(columns, values)
+    }
+
+def _read_csv(path, dtype=None, parse_dates=None):
+    """Read a demo CSV with vectorized dtype/date conversion, NaN -> None"""
+    if _pacsv is not None:
+        df = _pacsv.read_csv(path).to_pandas()
+        if dtype:
+            df = df.astype(dtype)
+    else:
+        df = pd.read_csv(path, dtype=dtype)
+    for col in (parse_dates or []):
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col])
+    # Normalize missing values to None once, instead of pd.notna per cell
+    return df.astype(object).where(df.notna(), None)
+
+def _db_value(v):
+    """Convert a Python value to SQLModel's SQLite storage format"""
+    if isinstance(v, UUID):
+        return v.hex  # SQLModel's GUID type stores 32-char hex
+    if isinstance(v, datetime):
+        return v.strftime("%Y-%m-%d %H:%M:%S.%f")
+    if isinstance(v, date):
+        return v.strftime("%Y-%m-%d")
+    return v
+
+def _bulk_insert(conn, table, rows):
+    """Insert converted row dicts through one prepared statement"""
+    if not rows:
+        return
+    columns = list(rows[0].keys())
+    sql = "INSERT INTO {} ({}) VALUES ({})".format(
+        table, ", ".join(columns), ", ".join("?" * len(columns))
+    )
+    params = [tuple(_db_value(row[c]) for c in columns) for row in rows]
+    cur = conn.cursor()
+    try:
+        cur.executemany(sql, params)
+    finally:
+        cur.close()
+
+def _company_rows(df):
+    """Build company row dicts from a parsed DataFrame"""
+    columns = df.columns.tolist()
+    rows = []
+    for values in df.itertuples(index=False, name=None):
+        kwargs = _row_kwargs(columns, values)
+        if kwargs.get('id') is None:
+            kwargs['id'] = uuid4()
+        if kwargs.get('created_at') is None:
+            kwargs['created_at'] = datetime.utcnow()
+        rows.append(kwargs)
+    return rows
+
+def _product_rows(df):
+    """Build product row dicts from a parsed DataFrame"""
+    columns = df.columns.tolist()
+    rows = []
+    for values in df.itertuples(index=False, name=None):
+        kwargs = _row_kwargs(columns, values)
+        if kwargs.get('id') is None:
+            kwargs['id'] = uuid4()
+        rows.append(kwargs)
+    return rows
+
+def _user_rows(df):
+    """Build user row dicts from a parsed DataFrame"""
+    columns = df.columns.tolist()
+    rows = []
+    for values in df.itertuples(index=False, name=None):
+        kwargs = _row_kwargs(columns, values)
+        if kwargs.get('id') is None:
+            kwargs['id'] = uuid4()
+        # Normalize the embedded JSON columns once at import time so bad
+        # values fail here instead of on every later attribute access
+        for col in ('channels_engaged', 'purchase_history'):
+            v = kwargs.get(col)
+            if v is not None:
+                kwargs[col] = orjson.dumps(orjson.loads(v)).decode()
+        rows.append(kwargs)
+    return rows
+
+def _asset_rows(df):
+    """Build content-asset row dicts from a parsed DataFrame"""
+    columns = df.columns.tolist()
+    rows = []
+    for values in df.itertuples(index=False, name=None):
+        kwargs = _row_kwargs(columns, values)
+        if kwargs.get('id') is None:
+            kwargs['id'] = uuid4()
+        if kwargs.get('status') is None:
+            kwargs['status'] = 'draft'
+        # created_at is filled server-side (CURRENT_TIMESTAMP default)
+        rows.append(kwargs)
+    return rows
+
+def _metric_rows(df):
+    """Build metric row dicts from a parsed DataFrame"""
+    columns = df.columns.tolist()
+    rows = []
+    for values in df.itertuples(index=False, name=None):
+        kwargs = _row_kwargs(columns, values)
+        if kwargs.get('id') is None:
+            kwargs['id'] = uuid4()
+        for col, default in (('clicks', 0), ('impressions', 0),
+                             ('engagement_rate', 0.0), ('conversion_rate', 0.0),
+                             ('cpa', 0.0)):
+            if kwargs.get(col) is None:
+                kwargs[col] = default
+        if kwargs.get('timestamp') is None:
+            kwargs['timestamp'] = datetime.utcnow()
+        rows.append(kwargs)
+    return rows
+
+# (csv file, table name, read kwargs, row builder) in load order
+_TABLE_SPECS = [
+    ("companies.csv", "companies",
+     {'parse_dates': ['created_at']}, _company_rows),
+    ("products.csv", "products",
+     {'parse_dates': ['launch_date']}, _product_rows),
+    ("users.csv", "users",
+     {'dtype': {'age': 'Int64'}}, _user_rows),
+    ("content_assets.csv", "content_assets",
+     {}, _asset_rows),
+    ("metrics.csv", "metrics",
+     {'dtype': {'clicks': 'Int64', 'impressions': 'Int64',
+                'engagement_rate': 'float64', 'conversion_rate': 'float64',
+                'cpa': 'float64'},
+      'parse_dates': ['timestamp']}, _metric_rows),
+]
+
+def _parse_table(demo_path, spec):
+    """Parse one table's CSV into insert-ready row dicts (runs off-thread)"""
+    csv_name, table, read_kwargs, build_rows = spec
+    csv_path = os.path.join(demo_path, csv_name)
+    if not os.path.exists(csv_path):
+        return table, 0, None
+    df = _read_csv(csv_path, **read_kwargs)
+    if df.empty:
+        return table, 0, None
+    return table, len(df), build_rows(df)
+
 def load_demo_data():
     """Load demo data from CSV files"""
     demo_path = os.path.join(os.path.dirname(__file__), "demo")
-    
-    with Session(engine) as session:
-        # Check if data already exists
-        existing_companies = session.query(Company).count()
-        if existing_companies > 0:
+
+    conn = engine.raw_connection()
+    try:
+        # Check if data already exists; EXISTS short-circuits at the first row
+        cur = conn.cursor()
+        cur.execute("SELECT EXISTS(SELECT 1 FROM companies LIMIT 1)")
+        has_companies = cur.fetchone()[0]
+        cur.close()
+        if has_companies:
             logger.info("Demo data already loaded, skipping...")
             return
-            
+
         try:
-            # Load companies
-            if os.path.exists(os.path.join(demo_path, "companies.csv")):
-                logger.info("Loading companies...")
-                companies_df = pd.read_csv(os.path.join(demo_path, "companies.csv"))
-                for _, row in companies_df.iterrows():
-                    # Check if company already exists
-                    if 'id' in row and pd.notna(row['id']):
-                        existing = session.get(Company, UUID(row['id']))
-                        if existing:
-                            continue
-                    
-                    company = Company(
-                        id=UUID(row['id']) if 'id' in row and pd.notna(row['id']) else None,
-                        company_name=row.get('company_name'),
-                        industry=row.get('industry'),
-                        brand_voice=row.get('brand_voice'),
-                        created_at=pd.to_datetime(row['created_at']) if 'created_at' in row and pd.notna(row['created_at']) else datetime.utcnow()
-                    )
-                    session.add(company)
-                session.commit()
-                logger.info(f"Loaded {len(companies_df)} companies")
-            
-            # Load products
-            if os.path.exists(os.path.join(demo_path, "products.csv")):
-                logger.info("Loading products...")
-                products_df = pd.read_csv(os.path.join(demo_path, "products.csv"))
-                for _, row in products_df.iterrows():
-                    product = Product(
-                        id=UUID(row['id']) if 'id' in row and pd.notna(row['id']) else None,
-                        company_id=UUID(row['company_id']) if 'company_id' in row and pd.notna(row['company_id']) else None,
-                        product_name=row.get('product_name'),
-                        description=row.get('description'),
-                        launch_date=pd.to_datetime(row['launch_date']).date() if 'launch_date' in row and pd.notna(row['launch_date']) else None,
-                        target_skin_type=row.get('target_skin_type')
-                    )
-                    session.add(product)
-                session.commit()
-                logger.info(f"Loaded {len(products_df)} products")
-            
-            # Load users
-            if os.path.exists(os.path.join(demo_path, "users.csv")):
-                logger.info("Loading users...")
-                users_df = pd.read_csv(os.path.join(demo_path, "users.csv"))
-                for _, row in users_df.iterrows():
-                    user = User(
-                        id=UUID(row['id']) if 'id' in row and pd.notna(row['id']) else None,  # Convert to UUID
-                        age=int(row['age']) if pd.notna(row.get('age')) else None,
-                        location=row.get('location'),
-                        skin_type=row.get('skin_type'),
-                        channels_engaged=row.get('channels_engaged'),
-                        purchase_history=row.get('purchase_history')
-                    )
-                    session.add(user)
-                session.commit()
-                logger.info(f"Loaded {len(users_df)} users")
-            
-            # Load content assets
-            if os.path.exists(os.path.join(demo_path, "content_assets.csv")):
-                logger.info("Loading content assets...")
-                assets_df = pd.read_csv(os.path.join(demo_path, "content_assets.csv"))
-                if not assets_df.empty:
-                    for _, row in assets_df.iterrows():
-                        asset = ContentAsset(
-                            id=UUID(row['id']) if 'id' in row and pd.notna(row['id']) else None,
-                            campaign_id=UUID(row['campaign_id']) if 'campaign_id' in row and pd.notna(row['campaign_id']) else None,
-                            platform=row.get('platform'),
-                            asset_type=row.get('asset_type'),
-                            copy_text=row.get('copy_text'),
-                            visual_url=row.get('visual_url'),
-                            status=row.get('status', 'draft')
-                        )
-                        session.add(asset)
-                    session.commit()
-                    logger.info(f"Loaded {len(assets_df)} content assets")
-            
-            # Load metrics
-            if os.path.exists(os.path.join(demo_path, "metrics.csv")):
-                logger.info("Loading metrics...")
-                metrics_df = pd.read_csv(os.path.join(demo_path, "metrics.csv"))
-                if not metrics_df.empty:
-                    for _, row in metrics_df.iterrows():
-                        metric = Metric(
-                            id=UUID(row['id']) if 'id' in row and pd.notna(row['id']) else None,
-                            campaign_id=UUID(row['campaign_id']) if 'campaign_id' in row and pd.notna(row['campaign_id']) else None,
-                            platform=row.get('platform'),
-                            clicks=int(row['clicks']) if pd.notna(row.get('clicks')) else 0,
-                            impressions=int(row['impressions']) if pd.notna(row.get('impressions')) else 0,
-                            engagement_rate=float(row['engagement_rate']) if pd.notna(row.get('engagement_rate')) else 0.0,
-                            conversion_rate=float(row['conversion_rate']) if pd.notna(row.get('conversion_rate')) else 0.0,
-                            cpa=float(row['cpa']) if pd.notna(row.get('cpa')) else 0.0,
-                            timestamp=pd.to_datetime(row['timestamp']) if 'timestamp' in row and pd.notna(row['timestamp']) else datetime.utcnow()
-                        )
-                        session.add(metric)
-                    session.commit()
-                    logger.info(f"Loaded {len(metrics_df)} metrics")
-            
+            # Parse CSV N+1 on worker threads while table N inserts on the
+            # main thread (SQLite writes must stay single-threaded). Futures
+            # are consumed in spec order so FK parents insert first.
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = [pool.submit(_parse_table, demo_path, spec)
+                           for spec in _TABLE_SPECS]
+                for future in futures:
+                    table, count, rows = future.result()
+                    if not rows:
+                        continue
+                    logger.info(f"Loading {table}...")
+                    _bulk_insert(conn, table, rows)
+                    logger.info(f"Loaded {count} {table}")
+
+            # One commit (and one fsync) for the entire load
+            conn.commit()
+
             # NOTE: Not loading any SetupConfiguration to ensure wizard runs
             logger.info("Demo data loaded successfully (no setup configuration)")
-            
+
         except Exception as e:
             logger.error(f"Error loading demo data: {str(e)}")
-            session.rollback()
+            conn.rollback()
             raise
+    finally:
+        conn.close()
 
 # Create demo CSV files if they don't exist
 def create_demo_files():
@@ -1,9 +1,11 @@
 # data/models.py
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, text
 from typing import Optional, List
 from datetime import datetime, date
 from uuid import UUID, uuid4
-import json
+import functools
+import orjson
 
 class Company(SQLModel, table=True):
     """Company model"""
@@ -13,7 +15,7 @@ class Company(SQLModel, table=True):
     company_name: Optional[str] = Field(default=None)
     industry: Optional[str] = Field(default=None)
     brand_voice: Optional[str] = Field(default=None)
-    created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")})
     
     # Relationships
     products: List["Product"] = Relationship(back_populates="company")
@@ -23,7 +25,7 @@ class Product(SQLModel, table=True):
     __tablename__ = "products"
     
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    company_id: Optional[UUID] = Field(default=None, foreign_key="companies.id")
+    company_id: Optional[UUID] = Field(default=None, foreign_key="companies.id", index=True)
     product_name: Optional[str] = Field(default=None)
     description: Optional[str] = Field(default=None)
     launch_date: Optional[date] = Field(default=None)
@@ -44,24 +46,51 @@ class User(SQLModel, table=True):
     channels_engaged: Optional[str] = Field(default=None)  # JSON string
     purchase_history: Optional[str] = Field(default=None)  # JSON string
     
-    @property
+    @functools.cached_property
     def channels_engaged_list(self) -> List[str]:
         if self.channels_engaged:
-            return json.loads(self.channels_engaged)
+            return orjson.loads(self.channels_engaged)
         return []
-    
-    @property
+
+    @functools.cached_property
     def purchase_history_list(self) -> List[dict]:
         if self.purchase_history:
-            return json.loads(self.purchase_history)
+            return orjson.loads(self.purchase_history)
         return []
 
+    @classmethod
+    def bulk_parse(cls, users: List["User"]) -> List[List[str]]:
+        """Parse channels_engaged for a batch of users in one pass"""
+        loads = orjson.loads
+        return [loads(u.channels_engaged) if u.channels_engaged else [] for u in users]
+
+    @classmethod
+    def channels_contain(cls, channel: str):
+        """SQL predicate: users whose channels_engaged JSON contains channel.
+
+        Evaluates inside SQLite's JSON1 extension (json_each), so filters
+        like select(User).where(User.channels_contain("facebook")) run in C
+        in the engine instead of loading every row and parsing in Python.
+        """
+        return text(
+            "EXISTS (SELECT 1 FROM json_each(users.channels_engaged) "
+            "WHERE json_each.value = :channel)"
+        ).bindparams(channel=channel)
+
+    @classmethod
+    def purchased(cls, product: str):
+        """SQL predicate: users whose purchase_history JSON contains product"""
+        return text(
+            "EXISTS (SELECT 1 FROM json_each(users.purchase_history) "
+            "WHERE json_each.value = :product)"
+        ).bindparams(product=product)
+
 class Campaign(SQLModel, table=True):
     """Campaign model"""
     __tablename__ = "campaigns"
     
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    product_id: Optional[UUID] = Field(default=None, foreign_key="products.id")
+    product_id: Optional[UUID] = Field(default=None, foreign_key="products.id", index=True)
     name: str
     description: Optional[str] = Field(default=None)
     channel: str  # facebook, email, google_seo
@@ -70,8 +99,8 @@ class Campaign(SQLModel, table=True):
     start_date: Optional[datetime] = Field(default=None)  # NEW FIELD
     budget: float = Field(default=0.0)
     status: str = Field(default="draft")  # draft, active, paused, completed
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")})
+    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")})
     
     # Relationships
     product: Optional[Product] = Relationship(back_populates="campaigns")
@@ -84,13 +113,13 @@ class ContentAsset(SQLModel, table=True):
     __tablename__ = "content_assets"
     
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    campaign_id: Optional[UUID] = Field(default=None, foreign_key="campaigns.id")
+    campaign_id: Optional[UUID] = Field(default=None, foreign_key="campaigns.id", index=True)
     platform: Optional[str] = Field(default=None)
     asset_type: Optional[str] = Field(default=None)  # text, image, video
     copy_text: Optional[str] = Field(default=None)
     visual_url: Optional[str] = Field(default=None)
     status: Optional[str] = Field(default="draft")  # draft, approved, published
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")})
     published_at: Optional[datetime] = Field(default=None)
     
     # Relationships
@@ -99,16 +128,18 @@ class ContentAsset(SQLModel, table=True):
 class Metric(SQLModel, table=True):
     """Metrics model"""
     __tablename__ = "metrics"
-    
+    # Combo index for the common (campaign, time-ordered) metric queries
+    __table_args__ = (Index("ix_metrics_campaign_time", "campaign_id", "timestamp"),)
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    campaign_id: Optional[UUID] = Field(default=None, foreign_key="campaigns.id")
+    campaign_id: Optional[UUID] = Field(default=None, foreign_key="campaigns.id", index=True)
     platform: Optional[str] = Field(default=None)
     clicks: Optional[int] = Field(default=0)
     impressions: Optional[int] = Field(default=0)
     engagement_rate: Optional[float] = Field(default=0.0)
     conversion_rate: Optional[float] = Field(default=0.0)
     cpa: Optional[float] = Field(default=0.0)  # Cost per acquisition
-    timestamp: Optional[datetime] = Field(default_factory=datetime.utcnow)
+    timestamp: Optional[datetime] = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")})
     
     # Relationships
     campaign: Optional[Campaign] = Relationship(back_populates="metrics")
@@ -126,7 +157,7 @@ class CustomerSegment(SQLModel, table=True):
     size: Optional[float] = Field(default=0)  # Percentage of total users
     channel_distribution: Optional[str] = Field(default=None)  # JSON string of channel percentages
     cluster_centroid: Optional[str] = Field(default=None)  # JSON string of centroid features
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")})
 
 class CampaignMetrics(SQLModel, table=True):
     """Campaign-specific metrics configuration"""
@@ -136,18 +167,18 @@ class CampaignMetrics(SQLModel, table=True):
     campaign_id: UUID = Field(foreign_key="campaigns.id", unique=True)
     channel: str
     metrics_config: str  # JSON string with mean/variance for each metric
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")})
 
 class Schedule(SQLModel, table=True):
     """Campaign Schedule model"""
     __tablename__ = "schedules"
     
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    campaign_id: UUID = Field(foreign_key="campaigns.id")
+    campaign_id: UUID = Field(foreign_key="campaigns.id", index=True)
     scheduled_time: datetime
     status: str = Field(default="pending")  # pending, executing, completed, failed
     job_id: Optional[str] = Field(default=None)  # APScheduler job ID
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")})
     executed_at: Optional[datetime] = Field(default=None)
     
     # Relationships
@@ -158,8 +189,8 @@ class SetupConfiguration(SQLModel, table=True):
     __tablename__ = "setup_configurations"
     
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    product_id: Optional[UUID] = Field(default=None, foreign_key="products.id")
-    company_id: Optional[UUID] = Field(default=None, foreign_key="companies.id")
+    product_id: Optional[UUID] = Field(default=None, foreign_key="products.id", index=True)
+    company_id: Optional[UUID] = Field(default=None, foreign_key="companies.id", index=True)
     market_details: Optional[str] = Field(default=None)  # JSON string
     strategic_goals: Optional[str] = Field(default=None)
     monthly_budget: float = Field(default=0.0)
@@ -167,7 +198,7 @@ class SetupConfiguration(SQLModel, table=True):
     rebalancing_frequency: str = Field(default="weekly")  # daily, weekly, monthly
     campaign_count: int = Field(default=5)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")})
 
 class GameState(SQLModel, table=True):
     """Game state tracking"""
@@ -179,17 +210,17 @@ class GameState(SQLModel, table=True):
     is_running: bool = Field(default=False)
     total_reach_optimal: float = Field(default=0.0)
     total_reach_non_optimal: float = Field(default=0.0)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")})
+    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")})
 
 class Transaction(SQLModel, table=True):
     """Transaction model for user purchases"""
     __tablename__ = "transactions"
     
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    user_id: str = Field(foreign_key="users.id")
-    product_id: UUID = Field(foreign_key="products.id")
+    user_id: str = Field(foreign_key="users.id", index=True)
+    product_id: UUID = Field(foreign_key="products.id", index=True)
     amount: float
     transaction_date: datetime
     channel: Optional[str] = Field(default=None)
-    campaign_id: Optional[UUID] = Field(default=None, foreign_key="campaigns.id")
+    campaign_id: Optional[UUID] = Field(default=None, foreign_key="campaigns.id", index=True)
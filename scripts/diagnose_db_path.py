@@ -3,6 +3,7 @@
 Script to diagnose database path issues
 """
 
+import json
 import os
 import sys
 import glob
@@ -10,6 +11,45 @@ import glob
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# Directories that can never contain our database; pruned before descent
+SKIP_DIRS = frozenset(['venv', 'node_modules', '.git', '__pycache__'])
+
+def _manifest_path(project_root):
+    return os.path.join(project_root, '.cache', 'db_paths.json')
+
+def _dir_signature(project_root):
+    """mtimes of the root and its top-level dirs; cheap staleness check"""
+    sig = {'.': os.stat(project_root).st_mtime}
+    with os.scandir(project_root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and entry.name not in SKIP_DIRS:
+                sig[entry.name] = entry.stat().st_mtime
+    return sig
+
+def _load_manifest(project_root, signature):
+    """Return cached results if the directory signature still matches"""
+    try:
+        with open(_manifest_path(project_root)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('signature') != signature:
+        return None
+    found = [tuple(item) for item in manifest.get('files', [])]
+    # Paranoia: a cached hit that vanished invalidates the whole manifest
+    if any(not os.path.exists(full_path) for _, full_path, _ in found):
+        return None
+    return found
+
+def _save_manifest(project_root, signature, found_files):
+    path = _manifest_path(project_root)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'signature': signature, 'files': found_files}, f)
+    except OSError:
+        pass  # cache is best-effort; next run just walks again
+
 def find_campaign_db_files():
     """Find all campaign.db files in the project"""
     print("SEARCHING FOR campaign.db FILES")
@@ -21,23 +61,45 @@ def find_campaign_db_files():
     
     # Search for all campaign.db files
     print("Found campaign.db files:")
+
+    # Reuse the last run's results when nothing under the root changed,
+    # skipping the recursive walk entirely
+    signature = _dir_signature(project_root)
+    cached = _load_manifest(project_root, signature)
+    if cached is not None:
+        for rel_path, full_path, size in cached:
+            print(f"  - {rel_path} ({size:.2f} KB)")
+        if not cached:
+            print("  No campaign.db files found!")
+        return cached
+
     found_files = []
-    
-    for root, dirs, files in os.walk(project_root):
-        # Skip venv and node_modules
-        dirs[:] = [d for d in dirs if d not in ['venv', 'node_modules', '.git', '__pycache__']]
-        
-        for file in files:
-            if file == 'campaign.db':
-                full_path = os.path.join(root, file)
-                rel_path = os.path.relpath(full_path, project_root)
-                size = os.path.getsize(full_path) / 1024  # KB
-                found_files.append((rel_path, full_path, size))
-                print(f"  - {rel_path} ({size:.2f} KB)")
+
+    # Explicit os.scandir stack instead of os.walk: cached DirEntry type
+    # and stat info mean one getdents pass per directory and no extra
+    # stat() for the file size, and skipped trees are never entered
+    stack = [project_root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name == 'campaign.db':
+                        full_path = entry.path
+                        rel_path = os.path.relpath(full_path, project_root)
+                        size = entry.stat().st_size / 1024  # KB
+                        found_files.append((rel_path, full_path, size))
+                        print(f"  - {rel_path} ({size:.2f} KB)")
+        except OSError:
+            continue
     
     if not found_files:
         print("  No campaign.db files found!")
-    
+
+    _save_manifest(project_root, signature, found_files)
     return found_files
 
 def check_database_configs():
@@ -5,6 +5,7 @@ Shows both APScheduler jobs and database Schedule records
 """
 
 import sys
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any
@@ -12,6 +13,7 @@ from typing import List, Dict, Any
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import func
 from sqlmodel import Session, select
 from data.database import engine
 from data.models import Schedule, Campaign, Product
@@ -42,38 +44,36 @@ def print_separator(title: str = "", width: int = 80):
 def get_apscheduler_jobs():
     """Get all jobs from APScheduler"""
     try:
-        # Initialize scheduler if not already running
+        # get_jobs() works on a non-started scheduler (it returns the
+        # pending jobs), so a read-only inspection never needs to spin up
+        # the executor threads and timer that start() creates
         if not scheduler.running:
-            print("Scheduler not running, starting it...")
-            scheduler.start()
-        
+            print("Scheduler not running, listing pending jobs...")
+
         jobs = scheduler.get_jobs()
         return jobs
     except Exception as e:
         print(f"Error accessing APScheduler: {e}")
         return []
 
-def get_database_schedules():
+def get_database_schedules(session):
     """Get all schedules from database"""
     schedules = []
-    with Session(engine) as session:
-        # Query schedules with related campaign info
-        query = select(Schedule).order_by(Schedule.scheduled_time)
-        db_schedules = session.exec(query).all()
-        
-        for schedule in db_schedules:
-            # Fetch related campaign
-            campaign = session.get(Campaign, schedule.campaign_id)
-            product = None
-            if campaign and campaign.product_id:
-                product = session.get(Product, campaign.product_id)
-            
-            schedules.append({
-                'schedule': schedule,
-                'campaign': campaign,
-                'product': product
-            })
-    
+    # One LEFT-JOINed query for schedule + campaign + product instead of
+    # two session.get round-trips per schedule row
+    query = (
+        select(Schedule, Campaign, Product)
+        .join(Campaign, Schedule.campaign_id == Campaign.id, isouter=True)
+        .join(Product, Campaign.product_id == Product.id, isouter=True)
+        .order_by(Schedule.scheduled_time)
+    )
+    for schedule, campaign, product in session.exec(query):
+        schedules.append({
+            'schedule': schedule,
+            'campaign': campaign,
+            'product': product
+        })
+
     return schedules
 
 def print_apscheduler_jobs():
@@ -110,11 +110,11 @@ def print_apscheduler_jobs():
         
         print_separator("", 40)
 
-def print_database_schedules():
+def print_database_schedules(session):
     """Print all schedules from database"""
     print_separator("DATABASE SCHEDULES", 80)
-    
-    schedules = get_database_schedules()
+
+    schedules = get_database_schedules(session)
     
     if not schedules:
         print("No schedules found in database")
@@ -123,13 +123,10 @@ def print_database_schedules():
     print(f"Total schedules in database: {len(schedules)}")
     print()
     
-    # Group by status
-    status_groups = {}
+    # Group by status (defaultdict: one hash lookup per row)
+    status_groups = defaultdict(list)
     for item in schedules:
-        status = item['schedule'].status
-        if status not in status_groups:
-            status_groups[status] = []
-        status_groups[status].append(item)
+        status_groups[item['schedule'].status].append(item)
     
     # Print schedules by status
     for status, items in status_groups.items():
@@ -159,13 +156,13 @@ def print_database_schedules():
             
             print()
 
-def check_schedule_consistency():
+def check_schedule_consistency(session):
     """Check consistency between APScheduler and database"""
     print_separator("CONSISTENCY CHECK", 80)
-    
+
     # Get jobs from both sources
     apscheduler_jobs = get_apscheduler_jobs()
-    db_schedules = get_database_schedules()
+    db_schedules = get_database_schedules(session)
     
     # Extract job IDs
     apscheduler_job_ids = {job.id for job in apscheduler_jobs}
@@ -209,58 +206,58 @@ def print_scheduler_configuration():
     except Exception as e:
         print(f"Error loading configuration: {e}")
 
-def get_execution_statistics():
+def get_execution_statistics(session):
     """Get statistics about schedule execution"""
     print_separator("EXECUTION STATISTICS", 80)
-    
-    with Session(engine) as session:
-        # Count schedules by status
-        status_counts = {}
-        for status in ['pending', 'executing', 'completed', 'failed']:
-            count = session.exec(
-                select(Schedule).where(Schedule.status == status)
-            ).all()
-            status_counts[status] = len(count)
-        
-        print("Schedule Status Distribution:")
-        for status, count in status_counts.items():
-            print(f"  {status.capitalize()}: {count}")
-        
-        # Get recent executions
-        print("\nRecent Executions (Last 10):")
-        recent = session.exec(
-            select(Schedule)
-            .where(Schedule.executed_at.is_not(None))
-            .order_by(Schedule.executed_at.desc())
-            .limit(10)
-        ).all()
-        
-        if recent:
-            for schedule in recent:
-                campaign = session.get(Campaign, schedule.campaign_id)
-                print(f"  - {format_datetime(schedule.executed_at)}: "
-                      f"{campaign.name if campaign else 'Unknown'} "
-                      f"({schedule.status})")
-        else:
-            print("  No executed schedules found")
-        
-        # Get upcoming schedules
-        print("\nUpcoming Schedules (Next 10):")
-        upcoming = session.exec(
-            select(Schedule)
-            .where(Schedule.status == 'pending')
-            .order_by(Schedule.scheduled_time)
-            .limit(10)
-        ).all()
-        
-        if upcoming:
-            for schedule in upcoming:
-                campaign = session.get(Campaign, schedule.campaign_id)
-                print(f"  - {format_datetime(schedule.scheduled_time)}: "
-                      f"{campaign.name if campaign else 'Unknown'} "
-                      f"(Job ID: {schedule.job_id or 'Not scheduled'})")
-        else:
-            print("  No upcoming schedules found")
+
+    # Count schedules by status with one grouped aggregate; the DB
+    # returns four integers instead of materializing every row
+    status_counts = {s: 0 for s in ['pending', 'executing', 'completed', 'failed']}
+    for status, count in session.exec(
+        select(Schedule.status, func.count()).group_by(Schedule.status)
+    ):
+        if status in status_counts:
+            status_counts[status] = count
+
+    print("Schedule Status Distribution:")
+    for status, count in status_counts.items():
+        print(f"  {status.capitalize()}: {count}")
+
+    # Get recent executions (campaign eagerly joined, no per-row get)
+    print("\nRecent Executions (Last 10):")
+    recent = session.exec(
+        select(Schedule, Campaign)
+        .join(Campaign, Schedule.campaign_id == Campaign.id, isouter=True)
+        .where(Schedule.executed_at.is_not(None))
+        .order_by(Schedule.executed_at.desc())
+        .limit(10)
+    ).all()
+
+    if recent:
+        for schedule, campaign in recent:
+            print(f"  - {format_datetime(schedule.executed_at)}: "
+                  f"{campaign.name if campaign else 'Unknown'} "
+                  f"({schedule.status})")
+    else:
+        print("  No executed schedules found")
+
+    # Get upcoming schedules (campaign eagerly joined, no per-row get)
+    print("\nUpcoming Schedules (Next 10):")
+    upcoming = session.exec(
+        select(Schedule, Campaign)
+        .join(Campaign, Schedule.campaign_id == Campaign.id, isouter=True)
+        .where(Schedule.status == 'pending')
+        .order_by(Schedule.scheduled_time)
+        .limit(10)
+    ).all()
+
+    if upcoming:
+        for schedule, campaign in upcoming:
+            print(f"  - {format_datetime(schedule.scheduled_time)}: "
+                  f"{campaign.name if campaign else 'Unknown'} "
+                  f"(Job ID: {schedule.job_id or 'Not scheduled'})")
+    else:
+        print("  No upcoming schedules found")
 
 def main():
     """Main function"""
@@ -272,19 +269,22 @@ def main():
     try:
         # Print configuration
         print_scheduler_configuration()
-        
+
         # Print APScheduler jobs
         print_apscheduler_jobs()
-        
-        # Print database schedules
-        print_database_schedules()
-        
-        # Check consistency
-        check_schedule_consistency()
-        
-        # Print statistics
-        get_execution_statistics()
-        
+
+        # One session (one pooled connection checkout) serves every
+        # database section of the report
+        with Session(engine) as session:
+            # Print database schedules
+            print_database_schedules(session)
+
+            # Check consistency
+            check_schedule_consistency(session)
+
+            # Print statistics
+            get_execution_statistics(session)
+
     except Exception as e:
         print(f"\nError during inspection: {e}")
         import traceback
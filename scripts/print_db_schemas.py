@@ -5,9 +5,10 @@ Script to print all table schemas from the SQLModel database
 
 import sys
 import os
-from sqlalchemy import inspect, MetaData
-from sqlmodel import Session, select
-from tabulate import tabulate
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import create_engine, inspect, MetaData
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session, select, text
 
 # Add parent directory to path to import project modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -19,14 +20,52 @@ from data.models import (
     Transaction, GameState, CampaignMetrics
 )
 
-def print_table_schema(inspector, table_name):
+def _grid(headers, rows):
+    """Render a tabulate-style grid table.
+
+    Plain width arithmetic and str.join: no per-cell type sniffing or
+    format dispatch, and one less third-party import for a dev script.
+    """
+    rows = [[str(c) for c in row] for row in rows]
+    widths = [len(h) for h in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+    sep = '+' + '+'.join('-' * (w + 2) for w in widths) + '+'
+    def line(cells):
+        return '| ' + ' | '.join(c.ljust(w) for c, w in zip(cells, widths)) + ' |'
+    out = [sep, line(headers), sep.replace('-', '=')]
+    for row in rows:
+        out.append(line(row))
+        out.append(sep)
+    return '\n'.join(out)
+
+# The app engine keeps a single pooled connection, which would serialize
+# the worker threads below; NullPool gives each inspection its own SQLite
+# connection (concurrent readers are fine). In-memory databases must stay
+# on the shared engine — a fresh connection would see an empty DB.
+if str(engine.url).startswith("sqlite") and ":memory:" not in str(engine.url):
+    _inspect_engine = create_engine(
+        engine.url, poolclass=NullPool,
+        connect_args={"check_same_thread": False}
+    )
+else:
+    _inspect_engine = engine
+
+def _fetch_table_schema(table_name):
+    """Fetch one table's metadata (runs on a worker thread)"""
+    insp = inspect(_inspect_engine)
+    return (insp.get_columns(table_name),
+            insp.get_foreign_keys(table_name),
+            insp.get_indexes(table_name))
+
+def print_table_schema(table_name, columns, foreign_keys, indexes):
     """Print schema information for a single table"""
     print(f"\n{'='*60}")
     print(f"TABLE: {table_name}")
     print('='*60)
-    
-    # Get columns
-    columns = inspector.get_columns(table_name)
+
     column_data = []
     
     for col in columns:
@@ -38,21 +77,15 @@ def print_table_schema(inspector, table_name):
             'PRIMARY KEY' if col.get('primary_key') else ''
         ])
     
-    print(tabulate(
-        column_data,
-        headers=['Column', 'Type', 'Nullable', 'Default', 'Key'],
-        tablefmt='grid'
-    ))
-    
-    # Get foreign keys
-    foreign_keys = inspector.get_foreign_keys(table_name)
+    print(_grid(['Column', 'Type', 'Nullable', 'Default', 'Key'], column_data))
+
+    # Foreign keys
     if foreign_keys:
         print("\nForeign Keys:")
         for fk in foreign_keys:
             print(f"  - {fk['constrained_columns']} -> {fk['referred_table']}.{fk['referred_columns']}")
-    
-    # Get indexes
-    indexes = inspector.get_indexes(table_name)
+
+    # Indexes
     if indexes:
         print("\nIndexes:")
         for idx in indexes:
@@ -74,13 +107,10 @@ def get_model_info():
         print(f"\n{model.__name__} ({model.__tablename__}):")
         print(f"  Description: {model.__doc__ or 'No description'}")
         
-        # Get relationships
-        relationships = []
-        for attr_name in dir(model):
-            attr = getattr(model, attr_name)
-            if hasattr(attr, 'property') and hasattr(attr.property, 'mapper'):
-                relationships.append(attr_name)
-        
+        # The mapper already knows its relationships; asking it directly
+        # avoids the dir()/getattr scan over every class attribute
+        relationships = list(inspect(model).relationships.keys())
+
         if relationships:
             print(f"  Relationships: {', '.join(relationships)}")
 
@@ -107,16 +137,31 @@ def get_table_counts(session):
     
     count_data = []
     total_rows = 0
-    
-    for model, table_name in models:
-        try:
-            count = session.query(model).count()
+
+    # One UNION ALL statement counts every table in a single round trip
+    # (table names are fixed literals from the model list, not user input)
+    try:
+        union_sql = " UNION ALL ".join(
+            f"SELECT '{table_name}', COUNT(*) FROM {table_name}"
+            for _, table_name in models
+        )
+        counts = dict(session.execute(text(union_sql)).all())
+        for _, table_name in models:
+            count = counts.get(table_name, 0)
             count_data.append([table_name, count])
             total_rows += count
-        except Exception as e:
-            count_data.append([table_name, f"Error: {str(e)}"])
-    
-    print(tabulate(count_data, headers=['Table', 'Row Count'], tablefmt='grid'))
+    except Exception:
+        # Fall back to per-table counts so one missing table doesn't
+        # blank out the whole report
+        for model, table_name in models:
+            try:
+                count = session.query(model).count()
+                count_data.append([table_name, count])
+                total_rows += count
+            except Exception as e:
+                count_data.append([table_name, f"Error: {str(e)}"])
+    
+    print(_grid(['Table', 'Row Count'], count_data))
     print(f"\nTotal rows across all tables: {total_rows}")
 
 def main():
@@ -135,9 +180,14 @@ def main():
     # Print model information
     get_model_info()
     
-    # Print schema for each table
-    for table_name in sorted(table_names):
-        print_table_schema(inspector, table_name)
+    # Fetch every table's metadata in parallel (the per-table PRAGMA
+    # round-trips overlap), then print in sorted order as futures resolve
+    ordered = sorted(table_names)
+    with ThreadPoolExecutor(max_workers=min(8, len(ordered))) as pool:
+        futures = [pool.submit(_fetch_table_schema, name) for name in ordered]
+        for table_name, future in zip(ordered, futures):
+            columns, foreign_keys, indexes = future.result()
+            print_table_schema(table_name, columns, foreign_keys, indexes)
     
     # Get row counts
     with Session(engine) as session: